@@ -1,17 +1,47 @@
-import json
+import codecs
+import contextvars
+import mmap
 import os
+import posixpath
+import shutil
+import signal
+import sys
+import threading
 import time
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+from functools import partial
 from pathlib import Path
+from typing import IO, Iterator
 
-import pandas as pd
+import ijson
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import typer
 from loguru import logger
 from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as _loads
+    except ImportError:
+        from json import loads as _loads
+
+    def json_loads(content):  # Only orjson parses a memoryview without a copy
+        return _loads(bytes(content))
+
 
 app = typer.Typer()
 output_dir = "extracted"
+vpa_view_file = "DaxVpaView.json"
+buffer_size = 1 << 20  # 1 MiB, used for the large file writes
+debounce_delay = 2.0  # Seconds without events before a watched VPAX is processed
 
 
 class VPAXEventHandler(FileSystemEventHandler):
@@ -25,64 +55,305 @@ class VPAXEventHandler(FileSystemEventHandler):
         The folder being watched for changes.
     replace : bool
         Flag indicating whether to replace existing extracted files.
+    low_memory : bool
+        Flag indicating whether to stream the JSON file to lower the memory usage.
+    persist_extracted : bool
+        Flag indicating whether to extract the VPAX contents to disk.
     """
 
-    def __init__(self, folder_to_watch: Path, replace: bool):
+    def __init__(
+        self,
+        folder_to_watch: Path,
+        replace: bool,
+        low_memory: bool = False,
+        persist_extracted: bool = False,
+    ):
         self.folder_to_watch = folder_to_watch
         self.replace = replace
+        self.low_memory = low_memory
+        self.persist_extracted = persist_extracted
+        self._pending: dict[str, threading.Timer] = {}
+        self._in_progress: dict[str, threading.Thread] = {}
+        self._stopped = False
+        self._lock = threading.Lock()
+
+    def schedule(self, vpax_file: str) -> None:
+        """
+        Schedules the processing of a VPAX file once no event has been received for
+        it during `debounce_delay` seconds. A file being uploaded triggers many
+        events, each of them postpones the processing instead of starting it.
+
+        Parameters
+        ----------
+        vpax_file : str
+            The path to the VPAX file, as received from the event.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+
+            timer = self._pending.get(vpax_file)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(debounce_delay, self.process, args=(vpax_file,))
+            self._pending[vpax_file] = timer
+            timer.start()
+
+    def process(self, vpax_file: str) -> None:
+        """
+        Processes a VPAX file scheduled by `schedule`. Does nothing if a newer timer
+        replaced this one, and postpones the processing if the file is still growing
+        or already being processed by another timer, so that a file is never
+        processed twice at the same time.
+
+        Parameters
+        ----------
+        vpax_file : str
+            The path to the VPAX file, as received from the event.
+        """
+        with self._lock:
+            # A newer timer may have replaced this one in the meantime
+            if self._pending.get(vpax_file) is not threading.current_thread():
+                return
+            del self._pending[vpax_file]
+
+            busy = vpax_file in self._in_progress
+            if not busy:
+                self._in_progress[vpax_file] = threading.current_thread()
+
+        if busy:
+            logger.info(f"VPAX file already being processed: {vpax_file}")
+            self.schedule(vpax_file)
+            return
+
+        try:
+            try:
+                size = os.path.getsize(vpax_file)
+                time.sleep(0.1)
+                still_growing = os.path.getsize(vpax_file) != size
+            except FileNotFoundError:
+                logger.info(f"VPAX file removed before processing: {vpax_file}")
+                return
+
+            if still_growing:
+                logger.info(f"VPAX file still being written: {vpax_file}")
+                self.schedule(vpax_file)
+                return
+
+            process_vpax_file(
+                vpax_file, self.replace, self.low_memory, self.persist_extracted
+            )
+        finally:
+            with self._lock:
+                del self._in_progress[vpax_file]
+
+    def stop(self) -> None:
+        """
+        Stops scheduling VPAX files. The files waiting for their timer are dropped
+        and logged, as their upload may not be complete, while the files already
+        being processed are waited for so that their CSV files are complete.
+        """
+        with self._lock:
+            self._stopped = True
+            for vpax_file, timer in self._pending.items():
+                timer.cancel()
+                logger.warning(f"VPAX file dropped before processing: {vpax_file}")
+            self._pending.clear()
+            in_progress = list(self._in_progress.values())
+
+        for thread in in_progress:
+            thread.join()
 
     def on_modified(self, event):
         """
         Handler for the modified event. If the modified file is a VPAX file,
-        triggers the extraction process.
+        schedules the extraction process.
 
         Parameters
         ----------
         event : watchdog.events.FileModifiedEvent
             The file system event triggered by file modification.
         """
-        if isinstance(event, FileModifiedEvent) and event.src_path.endswith(".vpax"):
-            vpax_file = Path(event.src_path)
-            logger.info(f"Modified VPAX file detected: {vpax_file}")
-            extract_infos_from_vpax(
-                vpax_file,
-                self.replace,
-                ["Measures", "Tables", "Columns", "Relationships"],
-            )
+        if event.is_directory:
+            return
+
+        src_path = event.src_path
+        if isinstance(event, FileModifiedEvent) and src_path.endswith(".vpax"):
+            logger.info(f"Modified VPAX file detected: {src_path}")
+            self.schedule(src_path)
 
     def on_created(self, event):
         """
         Handler for the created event. If the created file is a VPAX file,
-        triggers the extraction process.
+        schedules the extraction process.
 
         Parameters
         ----------
         event : watchdog.events.FileCreatedEvent
             The file system event triggered by file creation.
         """
-        if isinstance(event, FileCreatedEvent) and event.src_path.endswith(".vpax"):
-            vpax_file = Path(event.src_path)
-            logger.info(f"New VPAX file detected: {vpax_file}")
-            extract_infos_from_vpax(
-                vpax_file,
-                self.replace,
-                ["Measures", "Tables", "Columns", "Relationships"],
-            )
+        if event.is_directory:
+            return
 
+        src_path = event.src_path
+        if isinstance(event, FileCreatedEvent) and src_path.endswith(".vpax"):
+            logger.info(f"New VPAX file detected: {src_path}")
+            self.schedule(src_path)
 
-def setup_logging(vpax_file: Path) -> None:
+
+def setup_logging(vpax_file: Path) -> int:
     """
     Configures logging for the application, placing log files alongside the VPAX files.
+    The sink only accepts the messages logged within `logger.contextualize(vpax=...)`
+    for this VPAX file, so that files processed concurrently do not write to each
+    other's log. The caller removes the sink with the returned id once the VPAX file
+    is processed.
 
     Parameters
     ----------
     vpax_file : Path
         The path to the VPAX file, used to determine where the log file will be saved.
+
+    Returns
+    -------
+    int
+        The id of the log file sink.
     """
     fmt_info = "{time:YYYY-MM-DD HH:mm:ss} | {name} | {level} | {message}"
-    log_file = Path(vpax_file).parent / Path(vpax_file).stem / "vpax.log"
+    log_file = vpax_file.with_suffix("") / "vpax.log"
     log_file.parent.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
-    logger.add(log_file, format=fmt_info, level="INFO")
+
+    key = str(vpax_file)
+    return logger.add(
+        log_file,
+        format=fmt_info,
+        level="INFO",
+        filter=lambda record: record["extra"].get("vpax") == key,
+    )
+
+
+def setup_console_logging() -> None:
+    """
+    Replaces the console sinks with a single INFO one, so that the DEBUG messages are
+    not even formatted. Used by `watch_folder`, and as the initializer of the worker
+    processes of `process_folder` as loguru handlers are not fork-safe.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+
+def process_vpax_file(
+    vpax_file: Path | str,
+    replace: bool,
+    low_memory: bool = False,
+    persist_extracted: bool = False,
+) -> None:
+    """
+    Processes a single VPAX file: configures its log file and extracts the infos.
+    Designed to run in a worker process of `process_folder` or in a thread of
+    `VPAXEventHandler`.
+
+    Parameters
+    ----------
+    vpax_file : Path | str
+        The path to the VPAX file.
+    replace : bool
+        Whether to replace the existing extracted files.
+    low_memory : bool
+        Whether to stream the JSON file to lower the memory usage.
+    persist_extracted : bool
+        Whether to extract the VPAX contents to disk.
+    """
+    vpax_file = Path(vpax_file)  # The only conversion, the callees expect a Path
+
+    # Setup logging for each VPAX file
+    handler_id = setup_logging(vpax_file)
+
+    try:
+        with logger.contextualize(vpax=str(vpax_file)):
+            logger.info(f"Processing VPAX file: {vpax_file}")
+
+            extract_infos_from_vpax(
+                vpax_file,
+                replace,
+                ["Measures", "Tables", "Columns", "Relationships"],
+                low_memory,
+                persist_extracted,
+            )
+    finally:
+        logger.remove(handler_id)
+
+
+def is_member_extracted(member: zipfile.ZipInfo, target: Path) -> bool:
+    """
+    Checks whether a member of a VPAX file is already extracted, comparing the size
+    and the CRC32 of the file on disk with the ones of the archive central directory.
+
+    Parameters
+    ----------
+    member : zipfile.ZipInfo
+        The archive member.
+    target : Path
+        The path where the member is extracted.
+
+    Returns
+    -------
+    bool
+        True if the file on disk matches the member.
+    """
+    try:
+        if target.stat().st_size != member.file_size:
+            return False
+    except FileNotFoundError:
+        return False
+
+    if member.file_size == 0:
+        return True  # An empty file cannot be mapped
+
+    with (
+        open(target, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        return zlib.crc32(mm) == member.CRC
+
+
+def extract_member(
+    vpax_file: Path, member: zipfile.ZipInfo, path_to_output: Path
+) -> bool:
+    """
+    Extract a single member of a VPAX file, unless it is already extracted. Each call
+    opens its own handle on the archive so that members can be extracted
+    concurrently.
+
+    Parameters
+    ----------
+    vpax_file : Path
+        The path to the VPAX file.
+    member : zipfile.ZipInfo
+        The archive member to extract.
+    path_to_output : Path
+        The directory where the member is extracted.
+
+    Returns
+    -------
+    bool
+        True if the member has been extracted, False if it was already up to date.
+    """
+    target = path_to_output / member.filename
+
+    # Checking the CRC32 is cheaper than inflating the member again
+    if is_member_extracted(member, target):
+        logger.debug("VPAX member already extracted: {}", member.filename)
+        return False
+
+    with zipfile.ZipFile(vpax_file, "r") as zip_ref:
+        with (
+            zip_ref.open(member) as src,
+            open(target, "wb", buffering=buffer_size) as dst,
+        ):
+            shutil.copyfileobj(src, dst, length=buffer_size)
+    logger.debug("Extracted VPAX member: {}", member.filename)
+    return True
 
 
 def extract_vpax(vpax_file: Path) -> None:
@@ -94,24 +365,224 @@ def extract_vpax(vpax_file: Path) -> None:
     vpax_file : Path
         The path to the VPAX file that needs to be extracted.
     """
-    path_to_output = Path(vpax_file).parent / Path(vpax_file).stem / output_dir
+    path_to_output = vpax_file.with_suffix("") / output_dir
     logger.info(f"START - Extracting VPAX file: {vpax_file} to {path_to_output}")
 
     with zipfile.ZipFile(vpax_file, "r") as zip_ref:
-        zip_ref.extractall(path_to_output)
-        logger.info(f"Extracted VPAX contents to {path_to_output}")
+        members = [member for member in zip_ref.infolist() if not member.is_dir()]
+
+    # Create all the directories up front so the workers never race on them
+    output_root = path_to_output.resolve()
+    for folder in {posixpath.dirname(member.filename) for member in members}:
+        folder_path = (path_to_output / folder).resolve()
+        if not folder_path.is_relative_to(output_root):
+            raise ValueError(f"Unsafe path in VPAX file {vpax_file}: {folder}")
+        folder_path.mkdir(parents=True, exist_ok=True)
+
+    # Each task runs in a copy of the logging context, threads do not inherit it
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                extract_member,
+                vpax_file,
+                member,
+                path_to_output,
+            )
+            for member in members
+        ]
+        extracted = sum(future.result() for future in futures)
+    logger.info(
+        f"Extracted VPAX contents to {path_to_output} ({extracted} members written, "
+        f"{len(members) - extracted} already up to date)"
+    )
+
+    # List the extracted JSON files, they are parsed later on when needed
+    for file_path in path_to_output.rglob("*.json"):
+        # Formatted by loguru only if a sink accepts DEBUG records
+        logger.debug("Extracted JSON file: {}", file_path)
+
+
+def read_json(path_to_json: Path) -> dict:
+    """
+    Reads a JSON file through a memory map, so that the parser works directly on
+    the mapped pages instead of a copy of the file. The UTF-8 BOM is skipped.
+
+    Parameters
+    ----------
+    path_to_json : Path
+        The path to the JSON file.
+
+    Returns
+    -------
+    dict
+        The parsed JSON content.
+    """
+    with (
+        open(path_to_json, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        start = len(codecs.BOM_UTF8) if mm[:3] == codecs.BOM_UTF8 else 0
+        with memoryview(mm) as view, view[start:] as content:
+            return json_loads(content)
+
+
+def open_vpax_json(vpax_file: Path) -> IO[bytes]:
+    """
+    Opens the DaxVpaView.json file straight from a VPAX file, without extracting it
+    to disk. The archive stays open until the returned file is closed.
+
+    Parameters
+    ----------
+    vpax_file : Path
+        The path to the VPAX file.
+
+    Returns
+    -------
+    IO[bytes]
+        The DaxVpaView.json file, opened in binary mode.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the VPAX file does not contain a DaxVpaView.json file.
+    """
+    with zipfile.ZipFile(vpax_file, "r") as zip_ref:
+        try:
+            return zip_ref.open(vpa_view_file)
+        except KeyError as e:
+            raise FileNotFoundError(f"{vpa_view_file} not found in {vpax_file}") from e
+
+
+def read_vpax_json(vpax_file: Path) -> dict:
+    """
+    Reads the DaxVpaView.json file straight from a VPAX file. The UTF-8 BOM is
+    skipped.
+
+    Parameters
+    ----------
+    vpax_file : Path
+        The path to the VPAX file.
+
+    Returns
+    -------
+    dict
+        The parsed JSON content.
+    """
+    with open_vpax_json(vpax_file) as f:
+        return json_loads(f.read().removeprefix(codecs.BOM_UTF8))
+
+
+def iter_json_sections(f: IO[bytes], infos: list) -> Iterator[tuple[str, list]]:
+    """
+    Streams the top-level sections of a JSON file with ijson and yields the requested
+    ones. Only the requested sections are built, one at a time, the others are
+    skipped event by event without being held in memory.
+
+    The numbers are converted the way orjson parses them, so that the records match
+    the ones of `read_json`: decimals become floats, and so do the integers that fit
+    neither int64 nor uint64.
+
+    Parameters
+    ----------
+    f : IO[bytes]
+        The JSON file, opened in binary mode.
+    infos : list
+        The names of the sections to yield.
+
+    Yields
+    ------
+    tuple[str, list]
+        The name of the section and its records.
+    """
+    if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+        f.seek(0)
+
+    key, builder = None, None
+    # use_float is not set as its native integers abort on the first one beyond int64
+    for prefix, event, value in ijson.parse(f):
+        if not prefix:
+            if event == "map_key":
+                key = value
+                builder = ijson.ObjectBuilder() if key in infos else None
+            continue
+
+        if builder is not None:
+            if event == "number" and (
+                isinstance(value, Decimal) or not -(1 << 63) <= value < 1 << 64
+            ):
+                value = float(value)
+            builder.event(event, value)
+            # The section is complete once its own closing (or scalar) event is seen
+            if prefix == key and event not in ("start_map", "start_array"):
+                yield key, builder.value
+                builder = None
+
+
+def records_to_table(records: list) -> pa.Table:
+    """
+    Converts a list of records to an Arrow table. When the records cannot be typed
+    as a whole, they are typed column by column and the columns Arrow cannot
+    represent in a CSV (mixed types, integers beyond int64, nested values) are
+    converted to text.
+
+    Parameters
+    ----------
+    records : list
+        The records to convert, as a list of dictionaries.
+
+    Returns
+    -------
+    pa.Table
+        The table, with one column per key found in the records.
+    """
+    try:
+        # Unlike Table.from_pylist, the struct type is inferred over all the rows
+        table = pa.Table.from_struct_array(pa.array(records))
+        if not any(pa.types.is_nested(field.type) for field in table.schema):
+            return table
+    except (pa.ArrowException, TypeError, OverflowError):
+        pass
+
+    keys = dict.fromkeys(key for record in records for key in record)
+    columns = {}
+    for key in keys:
+        values = [record.get(key) for record in records]
+        try:
+            column = pa.array(values)
+            if pa.types.is_nested(column.type):
+                raise TypeError(f"Nested column: {key}")
+        except (pa.ArrowException, TypeError, OverflowError):
+            column = pa.array(
+                [None if value is None else str(value) for value in values],
+                pa.string(),
+            )
+        columns[key] = column
+    return pa.table(columns)
 
-    # Optionally read and process the extracted JSON files if needed
-    for root, dirs, files in os.walk(path_to_output):
-        for file in files:
-            if file.endswith(".json"):
-                file_path = os.path.join(root, file)
-                logger.info(f"Reading JSON file: {file_path}")
-                with open(file_path, "r", encoding="utf-8-sig") as f:
-                    data = json.load(f)
+
+def export_to_csv(records: list, output_file: Path) -> None:
+    """
+    Export a list of records to a CSV file, built and written by Arrow in C. All
+    the CSVs share the Arrow dialect: quoted header and text, true/false booleans.
+
+    Parameters
+    ----------
+    records : list
+        The records to export, as a list of dictionaries.
+    output_file : Path
+        The path to the CSV file.
+    """
+    pacsv.write_csv(records_to_table(records), output_file)
 
 
-def extract_infos_from_vpax(vpax_file: Path, replace: bool, infos: list = None) -> None:
+def extract_infos_from_vpax(
+    vpax_file: Path,
+    replace: bool,
+    infos: list = None,
+    low_memory: bool = False,
+    persist_extracted: bool = False,
+) -> None:
     """
     Extracts DAX measures from a VPAX JSON file and exports them to a CSV.
 
@@ -121,6 +592,16 @@ def extract_infos_from_vpax(vpax_file: Path, replace: bool, infos: list = None)
         The path to the VPAX file.
     replace : bool
         Whether to replace the existing extracted files.
+    infos : list, optional
+        The infos to extract. Defaults to Measures, Tables, Columns and Relationships.
+    low_memory : bool, optional
+        Whether to stream the JSON file, parsing and exporting one info at a time
+        instead of loading the whole file. Slower, but the memory usage is bounded by
+        the largest info. Defaults to False.
+    persist_extracted : bool, optional
+        Whether to extract the VPAX contents to disk and read the JSON file from
+        there. Otherwise the JSON file is read straight from the VPAX file. Defaults
+        to False.
     """
 
     # Check infos to extract
@@ -128,13 +609,18 @@ def extract_infos_from_vpax(vpax_file: Path, replace: bool, infos: list = None)
         infos = ["Measures", "Tables", "Columns", "Relationships"]
     logger.info(f"START - Extracting {infos} from VPAX.")
 
-    # Ensure the VPAX extraction has been done
-    path_to_json = (
-        Path(vpax_file).parent / Path(vpax_file).stem / output_dir / "DaxVpaView.json"
-    )
+    # All the outputs are written next to the VPAX file, in a folder named after it
+    work_dir = vpax_file.with_suffix("")
+
+    # The JSON file is read once extracted to disk, or straight from the VPAX file
+    path_to_json = work_dir / output_dir / vpa_view_file
+    json_source = path_to_json if persist_extracted else vpax_file / vpa_view_file
 
-    if replace:
-        logger.info("Replace extracted files from vpax")
+    if not persist_extracted:
+        logger.info(f"Reading {json_source} without extracting the VPAX file.")
+
+    elif replace:  # Ensure the VPAX extraction has been done
+        logger.info("Replace extracted files from vpax, unchanged files are kept")
         extract_vpax(vpax_file)
 
     elif not path_to_json.exists():
@@ -147,59 +633,98 @@ def extract_infos_from_vpax(vpax_file: Path, replace: bool, infos: list = None)
         )
 
     # Proceed to extract infos
+    output_files = {info: work_dir / f"{work_dir.name} - {info}.csv" for info in infos}
 
+    source_file = path_to_json if persist_extracted else vpax_file
     try:
-        # Read the JSON file
-        with open(path_to_json, "r", encoding="utf-8-sig") as f:
-            data = json.load(f)
-        logger.info(f"Successfully read the JSON file: {path_to_json}")
+        source_mtime = source_file.stat().st_mtime
     except FileNotFoundError as e:
-        logger.error(f"File not found: {path_to_json}")
-        raise e
-    except json.JSONDecodeError as e:
-        logger.error(f"Error decoding JSON file: {path_to_json}")
+        logger.error(f"File not found: {source_file}")
         raise e
 
-    logger.info(f"Start extracting extracted {infos} from VPAX file.")
-
-    for info in infos:
+    # Without replace, the CSVs more recent than their source are kept as is
+    outdated_infos = [
+        info
+        for info in infos
+        if replace
+        or not output_files[info].exists()
+        or output_files[info].stat().st_mtime < source_mtime
+    ]
+    if not outdated_infos:
+        logger.info(f"CSV files already up to date for {infos}, nothing to export.")
+        return
+
+    logger.info(f"Start extracting extracted {outdated_infos} from VPAX file.")
+    work_dir.mkdir(parents=True, exist_ok=True)  # All the CSVs share this directory
+
+    def export_info(info: str, records: list) -> None:
+        """Export the records of a single info to its CSV file."""
+        output_file = output_files[info]
         try:
-            # Convert to DataFrame
-            df = pd.DataFrame(data[info])
+            export_to_csv(records, output_file)
             logger.info(
-                f"Successfully converted {info} to DataFrame with {df.shape[0]} rows."
+                f"Successfully exported {info} ({len(records)} rows) to CSV: "
+                f"{output_file}"
             )
-        except KeyError as e:
-            logger.error(f"'{info}' key not found in the JSON file: {path_to_json}")
+        except Exception as e:
+            logger.error(f"Error exporting {info} to CSV: {output_file}")
             raise e
 
-        # Export to CSV
-        output_file = (
-            Path(vpax_file).parent
-            / Path(vpax_file).stem
-            / f"{Path(vpax_file).stem} - {info}.csv"
-        )
+    if low_memory:
         try:
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(output_file, index=False)
-            logger.info(f"Successfully exported {info} to CSV: {output_file}")
-        except Exception as e:
-            logger.error(f"Error exporting {info} to CSV: {output_file}")
+            if persist_extracted:
+                f = open(path_to_json, "rb")
+            else:
+                f = open_vpax_json(vpax_file)
+        except FileNotFoundError as e:
+            logger.error(f"File not found: {json_source}")
             raise e
-        # Export to CSV
-        output_file = (
-            Path(vpax_file).parent
-            / Path(vpax_file).stem
-            / f"{Path(vpax_file).stem} - {info}.csv"
-        )
+
+        # Each info is exported as soon as it is parsed, then released
+        exported_infos = set()
+        with f:
+            try:
+                for info, records in iter_json_sections(f, outdated_infos):
+                    export_info(info, records)
+                    exported_infos.add(info)
+            except ijson.JSONError as e:
+                logger.error(f"Error decoding JSON file: {json_source}")
+                raise e
+        logger.info(f"Successfully streamed the JSON file: {json_source}")
+
+    else:
         try:
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(output_file, index=False)
-            logger.info(f"Successfully exported {info} to CSV: {output_file}")
-        except Exception as e:
-            logger.error(f"Error exporting {info} to CSV: {output_file}")
+            # Read the JSON file
+            if persist_extracted:
+                data = read_json(path_to_json)
+            else:
+                data = read_vpax_json(vpax_file)
+            logger.info(f"Successfully read the JSON file: {json_source}")
+        except FileNotFoundError as e:
+            logger.error(f"File not found: {json_source}")
+            raise e
+        except ValueError as e:  # JSONDecodeError of every backend derives from it
+            logger.error(f"Error decoding JSON file: {json_source}")
             raise e
 
+        # The infos are independent, export them concurrently, each task running in a
+        # copy of the logging context as threads do not inherit it
+        exported_infos = {info for info in outdated_infos if info in data}
+        with ThreadPoolExecutor(max_workers=len(outdated_infos)) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, export_info, info, data[info]
+                )
+                for info in exported_infos
+            ]
+            for future in futures:
+                future.result()
+
+    for info in outdated_infos:
+        if info not in exported_infos:
+            logger.error(f"'{info}' key not found in the JSON file: {json_source}")
+            raise KeyError(info)
+
     logger.info(f"Successfully extracted {infos} from VPAX file.")
 
 
@@ -207,6 +732,12 @@ def extract_infos_from_vpax(vpax_file: Path, replace: bool, infos: list = None)
 def process_folder(
     main_path: Path = typer.Argument(None, help="The path containing the VPAX files."),
     replace: bool = typer.Option(True, help="Replace the existing files."),
+    low_memory: bool = typer.Option(
+        False, help="Stream the JSON files to lower the memory usage."
+    ),
+    persist_extracted: bool = typer.Option(
+        False, help="Extract the VPAX contents to disk before reading them."
+    ),
 ) -> None:
     """
     Main function to find and process all VPAX files in the specified folder.
@@ -219,6 +750,10 @@ def process_folder(
         to the current working directory.
     replace : bool
         Whether to replace the existing extracted files. Defaults to True.
+    low_memory : bool
+        Whether to stream the JSON files to lower the memory usage. Defaults to False.
+    persist_extracted : bool
+        Whether to extract the VPAX contents to disk. Defaults to False.
     """
     logger.info("LAUNCH PROCESS")
 
@@ -238,19 +773,46 @@ def process_folder(
         logger.info(f"No VPAX files found in the directory: {main_path}")
         raise typer.Exit(code=1)
 
-    for path_to_vpax in vpax_files:
-        logger.info(f"Processing VPAX file: {path_to_vpax}")
-
-        # Setup logging for each VPAX file
-        setup_logging(path_to_vpax)
-
-        extract_infos_from_vpax(
-            path_to_vpax, replace, ["Measures", "Tables", "Columns", "Relationships"]
+    # Each VPAX file is independent, process them in parallel
+    max_workers = min(len(vpax_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=setup_console_logging
+    ) as executor:
+        worker = partial(
+            process_vpax_file,
+            replace=replace,
+            low_memory=low_memory,
+            persist_extracted=persist_extracted,
         )
+        list(executor.map(worker, vpax_files))
 
     logger.info("END - All VPAX files processed.")
 
 
+def create_observer() -> BaseObserver:
+    """
+    Creates the observer with the native backend of the platform: inotify on Linux,
+    FSEvents on macOS. Unlike `Observer`, it does not silently fall back to polling
+    when the native backend is unavailable. Other platforms use `Observer`.
+
+    Returns
+    -------
+    BaseObserver
+        The observer to schedule the event handler on.
+    """
+    if sys.platform.startswith("linux"):
+        from watchdog.observers.inotify import InotifyObserver
+
+        return InotifyObserver()
+
+    if sys.platform == "darwin":
+        from watchdog.observers.fsevents import FSEventsObserver
+
+        return FSEventsObserver()
+
+    return Observer()
+
+
 # ! fonction à checker
 @app.command()
 def watch_folder(
@@ -258,6 +820,12 @@ def watch_folder(
         None, help="The path containing the VPAX files."
     ),
     replace: bool = typer.Option(True, help="Replace the existing files."),
+    low_memory: bool = typer.Option(
+        False, help="Stream the JSON files to lower the memory usage."
+    ),
+    persist_extracted: bool = typer.Option(
+        False, help="Extract the VPAX contents to disk before reading them."
+    ),
 ) -> None:
     """
     Watches the specified folder for changes and triggers VPAX extraction when new or
@@ -272,7 +840,17 @@ def watch_folder(
         working directory if not provided.
     replace : bool, optional
         Whether to replace the existing extracted files or not. Defaults to True.
+    low_memory : bool, optional
+        Whether to stream the JSON files to lower the memory usage. Defaults to False.
+    persist_extracted : bool, optional
+        Whether to extract the VPAX contents to disk. Defaults to False.
+
+    Notes
+    -----
+    On Ctrl+C, the VPAX files still waiting for `debounce_delay` are dropped and
+    logged, while the ones being processed are completed before exiting.
     """
+    setup_console_logging()
     logger.info("LAUNCH PROCESS")
 
     # Define the folder to watch
@@ -287,18 +865,19 @@ def watch_folder(
     logger.info(f"Watching folder: {folder_to_watch}")
 
     # Setup the event handler and observer
-    event_handler = VPAXEventHandler(folder_to_watch, replace)
-    observer = Observer()
+    event_handler = VPAXEventHandler(
+        folder_to_watch, replace, low_memory, persist_extracted
+    )
+    observer = create_observer()
     observer.schedule(event_handler, path=str(folder_to_watch), recursive=False)
-    observer.start()
 
-    try:
-        while True:
-            time.sleep(5)  # Sleep to avoid excessive CPU usage
-    except KeyboardInterrupt:
-        observer.stop()
-    finally:
-        observer.join()
+    # Wait for the observer thread until Ctrl+C stops it. The join has a timeout as
+    # an untimed one cannot be interrupted by Ctrl+C on Windows
+    signal.signal(signal.SIGINT, lambda *_: observer.stop())
+    observer.start()
+    while observer.is_alive():
+        observer.join(timeout=1)
+    event_handler.stop()
 
 
 if __name__ == "__main__":